@@ -0,0 +1,37 @@
+"""Benchmark agregasi daftar belanja untuk ribuan resep (tanpa GUI).
+
+Jalankan dengan: python benchmark_aggregation.py
+"""
+import random
+import time
+
+from recipe_model import Recipe, RecipeManager
+
+INGREDIENT_POOL = [
+    "2 butir telur", "200 gr keju", "1 kg beras", "3 sdm kecap manis",
+    "250 ml susu", "2 siung bawang putih", "garam", "1/2 gelas air",
+    "1.000 gram tepung", "1 1/2 sdt merica",
+]
+
+
+def benchmark_aggregation(recipe_count, repeat=5, seed=42):
+    """Mengukur rata-rata waktu aggregate_shopping_list untuk recipe_count resep."""
+    rng = random.Random(seed)
+    manager = RecipeManager(data_file=None)
+
+    for i in range(recipe_count):
+        ingredients = rng.sample(INGREDIENT_POOL, 5)
+        manager.add_recipe(Recipe(f"Resep {i}", ingredients, ["masak"], 10, servings=2))
+
+    selections = {name: rng.randint(1, 6) for name in manager.recipes}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = manager.aggregate_shopping_list(selections)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"⏱️ {recipe_count} recipes -> {len(result)} items in {elapsed * 1000:.2f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    for count in (1000, 5000, 20000):
+        benchmark_aggregation(count)
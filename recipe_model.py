@@ -0,0 +1,352 @@
+from collections import deque
+import json
+import math
+import os
+import re
+
+# --- MODUL 5 & 6: OBJECT ORIENTED PROGRAMMING I & II ---
+
+# Satuan dikelompokkan per dimensi: (nama dimensi, faktor ke satuan dasar).
+# Bahan tanpa satuan (misalnya '2 telur') dihitung dalam dimensi "jumlah".
+UNIT_TABLE = {
+    "g": ("berat", 1), "gr": ("berat", 1), "gram": ("berat", 1),
+    "ons": ("berat", 100), "kg": ("berat", 1000),
+    "ml": ("volume", 1), "sdt": ("volume", 5), "sdm": ("volume", 15),
+    "gelas": ("volume", 240), "cup": ("volume", 240),
+    "l": ("volume", 1000), "liter": ("volume", 1000),
+    "buah": ("jumlah", 1), "butir": ("jumlah", 1), "biji": ("jumlah", 1),
+    "pcs": ("jumlah", 1),
+    "siung": ("siung", 1), "lembar": ("lembar", 1), "batang": ("batang", 1),
+    "bungkus": ("bungkus", 1),
+}
+# Satuan yang dinaikkan agar mudah dibaca, misalnya 1500 gram -> 1,5 kg
+READABLE_UNITS = {"g": "kg", "gr": "kg", "gram": "kg", "ml": "liter"}
+# Untuk satuan besar, titik dibaca sebagai desimal: '2.500 kg' = 2,5 kg, bukan 2500 kg
+DECIMAL_DOT_UNITS = {"kg", "l", "liter"}
+
+# Jumlah: pecahan campuran '1 1/2', pecahan '1/2', ribuan '1.000', desimal '1,5'
+QUANTITY_PATTERN = re.compile(
+    r"^\s*(\d+\s+\d+/\d+|\d+/\d+|\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:[.,]\d+)?)\s+(.+)$"
+)
+
+
+def parse_quantity(text, unit=None):
+    """Mengubah teks jumlah menjadi float, atau None jika tidak valid.
+
+    Koma selalu desimal. Titik adalah pemisah ribuan ('1.000 gram'), kecuali
+    untuk satuan di DECIMAL_DOT_UNITS tanpa koma ('2.500 kg' = 2,5 kg).
+    """
+    text = text.strip()
+    try:
+        if "/" in text:
+            whole = 0
+            if " " in text:
+                whole, text = text.split(None, 1)
+            numerator, denominator = text.split("/")
+            if float(denominator) == 0:
+                return None
+            return float(whole) + float(numerator) / float(denominator)
+        if re.fullmatch(r"\d{1,3}(?:\.\d{3})+(?:,\d+)?", text):
+            if "," in text or unit not in DECIMAL_DOT_UNITS:
+                text = text.replace(".", "")
+        return float(text.replace(",", "."))
+    except ValueError:
+        return None
+
+
+def format_quantity(value):
+    """Menampilkan angka dengan koma desimal, tanpa desimal yang tidak perlu."""
+    value = round(value, 2)
+    if value == int(value):
+        return str(int(value))
+    return str(value).replace(".", ",")
+
+
+def split_ingredients(text):
+    """Memecah input bahan dari form. Pemisahnya titik koma karena koma dipakai untuk desimal."""
+    return [item.strip() for item in text.split(";") if item.strip()]
+
+
+def normalize_servings(value, default=1):
+    """Mengubah nilai porsi menjadi angka positif, atau default jika tidak valid."""
+    try:
+        servings = float(str(value).replace(",", "."))
+    except (TypeError, ValueError):
+        return default
+    if not math.isfinite(servings) or servings <= 0:
+        return default
+    return int(servings) if servings == int(servings) else servings
+
+
+class Ingredient:
+    """Bahan terstruktur: jumlah, satuan, dan nama bahan."""
+    def __init__(self, name, quantity=None, unit=None, text=None):
+        self.name = name.strip()
+        self.normalized_name = " ".join(self.name.lower().split())
+        self.quantity = quantity
+        self.unit = unit
+        self.text = text
+
+    @classmethod
+    def parse(cls, text):
+        """Membaca string bahan, misalnya 'telur', '2 butir telur' atau '1.000 gram tepung'."""
+        match = QUANTITY_PATTERN.match(text)
+        if not match:
+            return cls(text, text=text)
+
+        rest = match.group(2).split(None, 1)
+        unit = rest[0].lower()
+        if unit not in UNIT_TABLE:
+            unit = None
+        elif len(rest) < 2:
+            return cls(text, text=text)
+
+        quantity = parse_quantity(match.group(1), unit)
+        if quantity is None:
+            return cls(text, text=text)
+        if unit is None:
+            return cls(match.group(2), quantity, None, text=text)
+        return cls(rest[1], quantity, unit, text=text)
+
+    def dimension(self):
+        """Dimensi satuan (berat, volume, jumlah, ...) atau None jika tanpa jumlah."""
+        if self.quantity is None:
+            return None
+        return UNIT_TABLE.get(self.unit or "buah")[0]
+
+    def base_quantity(self):
+        """Jumlah bahan yang sudah dikonversi ke satuan dasar dimensinya."""
+        if self.quantity is None:
+            return None
+        return self.quantity * UNIT_TABLE.get(self.unit or "buah")[1]
+
+    def scaled(self, factor):
+        """Mengembalikan bahan dengan jumlah dikalikan faktor porsi."""
+        if self.quantity is None or factor == 1:
+            return self
+        return Ingredient(self.name, self.quantity * factor, self.unit)
+
+    def __str__(self):
+        if self.text is not None:
+            return self.text
+        if self.quantity is None:
+            return self.name
+        unit, quantity = self.unit, self.quantity
+        if unit in READABLE_UNITS and quantity >= 1000:
+            unit, quantity = READABLE_UNITS[unit], quantity / 1000
+        if unit is None:
+            return f"{format_quantity(quantity)} {self.name}"
+        return f"{format_quantity(quantity)} {unit} {self.name}"
+
+    def __repr__(self):
+        return f"Ingredient({self.name!r}, {self.quantity!r}, {self.unit!r})"
+
+
+def aggregate_ingredients(ingredients):
+    """Menjumlahkan bahan dalam satu kali lintasan (urutan kemunculan dipertahankan).
+
+    Bahan tanpa jumlah digabung ke bahan bernama sama yang punya jumlah.
+    Bahan yang tidak bergabung dengan apa pun dikembalikan apa adanya.
+    """
+    groups = {}
+    for ing in ingredients:
+        by_dimension = groups.setdefault(ing.normalized_name, {})
+        dimension = ing.dimension()
+        if dimension in by_dimension:
+            entry = by_dimension[dimension]
+            entry[1] += ing.base_quantity() or 0
+            entry[2] += 1
+        else:
+            by_dimension[dimension] = [ing, ing.base_quantity() or 0, 1]
+
+    result = []
+    for by_dimension in groups.values():
+        if len(by_dimension) > 1:
+            by_dimension.pop(None, None)
+        for first, total, count in by_dimension.values():
+            if count == 1 or first.quantity is None:
+                result.append(first)
+            else:
+                factor = UNIT_TABLE.get(first.unit or "buah")[1]
+                result.append(Ingredient(first.name, total / factor, first.unit))
+    return result
+
+
+class Recipe:
+    """Kelas dasar (Parent Class) untuk setiap resep."""
+    def __init__(self, name, ingredients, steps, cooking_time, servings=1):
+        self.name = name
+        self.ingredients = ingredients
+        self.steps = steps
+        self.cooking_time = cooking_time
+        self.servings = normalize_servings(servings)
+        self.is_favorite = False
+        self._parsed_ingredients = ((), [])
+
+    @property
+    def ingredient_items(self):
+        """Bahan dalam bentuk terstruktur, diparse ulang jika daftar string bahan berubah."""
+        source = tuple(self.ingredients)
+        if source != self._parsed_ingredients[0]:
+            self._parsed_ingredients = (source, [Ingredient.parse(ing) for ing in source])
+        return self._parsed_ingredients[1]
+
+    def scale_ingredients(self, servings):
+        """Menghitung bahan untuk jumlah porsi tertentu."""
+        factor = servings / self.servings
+        return [ing.scaled(factor) for ing in self.ingredient_items]
+
+    def display_details(self):
+        """Method dasar untuk menampilkan detail resep."""
+        details = f"Waktu Masak: {self.cooking_time} menit\n"
+        details += f"Bahan-bahan: {', '.join(self.ingredients)}\n"
+        details += f"Langkah: {'; '.join(self.steps)}"
+        return details
+    
+    def calculate_prep_time(self, prep_factor=0.2):
+        """Menghitung perkiraan waktu persiapan (Method)."""
+        return int(self.cooking_time * prep_factor)
+
+class HomemadeRecipe(Recipe):
+    """Kelas turunan untuk resep buatan sendiri."""
+    def __init__(self, name, ingredients, steps, cooking_time, source="Koleksi Pribadi", servings=1):
+        super().__init__(name, ingredients, steps, cooking_time, servings)
+        self.source = source
+        
+    def display_details(self):
+        base_details = super().display_details()
+        return f"{base_details}\nSumber: {self.source}"
+
+class RecipeManager:
+    """Mengelola koleksi resep dan struktur data, kini dengan persistensi data.
+
+    data_file=None membuat manager hanya di memori (tanpa baca/tulis file).
+    """
+    def __init__(self, data_file="recipe_data.json"):
+        self.data_file = data_file
+        self.recipes = {} 
+        self.shopping_queue = deque()     
+        self.history_stack = []          
+        
+
+        self.is_data_loaded = self.load_data() 
+
+    def add_recipe(self, recipe):
+        if recipe.name not in self.recipes:
+            self.recipes[recipe.name] = recipe
+            return True
+        return False
+
+    def add_to_shopping_list(self, item):
+        """Menambahkan item (teks atau Ingredient) ke Queue Daftar Belanja."""
+        if isinstance(item, str):
+            item = Ingredient.parse(item)
+        self.shopping_queue.append(item)
+
+    def remove_from_shopping_list(self):
+        """Mengambil item dari Queue (FIFO)."""
+        if self.shopping_queue:
+            return self.shopping_queue.popleft()
+        return None
+
+    def aggregate_shopping_list(self, selections):
+        """Menggabungkan bahan dari banyak resep. selections: {nama_resep: porsi}."""
+        ingredients = []
+        for name, servings in selections.items():
+            recipe = self.recipes.get(name)
+            if recipe:
+                ingredients.extend(recipe.scale_ingredients(servings))
+        return aggregate_ingredients(ingredients)
+
+    def add_recipes_to_shopping_list(self, selections):
+        """Menambahkan bahan resep ke Queue dan menjumlahkan bahan yang sama."""
+        # Queue menyimpan objek Ingredient, jadi jumlah tidak dibulatkan ulang setiap penambahan
+        ingredients = list(self.shopping_queue)
+        ingredients.extend(self.aggregate_shopping_list(selections))
+        self.shopping_queue = deque(aggregate_ingredients(ingredients))
+
+    def add_to_history(self, recipe_name):
+        """Menambahkan resep yang dilihat ke Stack."""
+        if recipe_name in self.recipes:
+            self.history_stack.append(recipe_name)
+
+    # ------------------------------------------------------------------
+    # --- FUNGSI PERSISTENSI DATA (JSON I/O) ---
+    # ------------------------------------------------------------------
+
+    def save_data(self):
+        """Menyimpan data resep dan shopping list ke file JSON."""
+        if self.data_file is None:
+            return
+
+        recipes_data = {}
+        for name, recipe in self.recipes.items():
+            data = {
+                "name": recipe.name,
+                "ingredients": recipe.ingredients,
+                "steps": recipe.steps,
+                "cooking_time": recipe.cooking_time,
+                "servings": recipe.servings,
+
+                "type": "HomemadeRecipe" if isinstance(recipe, HomemadeRecipe) else "Recipe",
+                "source": getattr(recipe, 'source', None) 
+            }
+            recipes_data[name] = data
+
+        data_to_save = {
+            "recipes": recipes_data,
+
+            "shopping_queue": [str(item) for item in self.shopping_queue] 
+        }
+
+        try:
+            with open(self.data_file, 'w') as f:
+                json.dump(data_to_save, f, indent=4)
+            print("💾 Data saved successfully.")
+        except Exception as e:
+            print(f"❌ Error saving data: {e}")
+
+    def load_data(self):
+        """Memuat data resep dan shopping list dari file JSON."""
+        if self.data_file is None:
+            return False
+
+        if not os.path.exists(self.data_file):
+            print(f"File '{self.data_file}' not found. Starting with initial data.")
+            return False
+            
+        try:
+            with open(self.data_file, 'r') as f:
+                data = json.load(f)
+                
+                # Memuat Resep
+                for name, recipe_data in data.get("recipes", {}).items():
+                    # Memilih kelas yang tepat (Polimorfisme)
+                    if recipe_data.get("type") == "HomemadeRecipe":
+                        recipe_obj = HomemadeRecipe(
+                            recipe_data["name"], 
+                            recipe_data["ingredients"], 
+                            recipe_data["steps"], 
+                            recipe_data["cooking_time"],
+                            source=recipe_data.get("source", "Koleksi Pribadi"),
+                            servings=normalize_servings(recipe_data.get("servings", 1))
+                        )
+                    else:
+                        recipe_obj = Recipe(
+                            recipe_data["name"], 
+                            recipe_data["ingredients"], 
+                            recipe_data["steps"], 
+                            recipe_data["cooking_time"],
+                            servings=normalize_servings(recipe_data.get("servings", 1))
+                        )
+                    self.recipes[name] = recipe_obj
+
+                # Memuat Queue
+                self.shopping_queue = deque(Ingredient.parse(item) for item in data.get("shopping_queue", []))
+            
+            print("✅ Data loaded successfully.")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error decoding JSON file or loading data: {e}. Starting with initial data.")
+            return False
@@ -3,145 +3,8 @@ from collections import deque
 import random
 from PIL import Image, ImageTk 
 
-import json 
-import os 
-
-# --- MODUL 5 & 6: OBJECT ORIENTED PROGRAMMING I & II ---
-
-class Recipe:
-    """Kelas dasar (Parent Class) untuk setiap resep."""
-    def __init__(self, name, ingredients, steps, cooking_time):
-        self.name = name                      
-        self.ingredients = ingredients          
-        self.steps = steps                      
-        self.cooking_time = cooking_time        
-        self.is_favorite = False                
-
-    def display_details(self):
-        """Method dasar untuk menampilkan detail resep."""
-        details = f"Waktu Masak: {self.cooking_time} menit\n"
-        details += f"Bahan-bahan: {', '.join(self.ingredients)}\n"
-        details += f"Langkah: {'; '.join(self.steps)}"
-        return details
-    
-    def calculate_prep_time(self, prep_factor=0.2):
-        """Menghitung perkiraan waktu persiapan (Method)."""
-        return int(self.cooking_time * prep_factor)
-
-class HomemadeRecipe(Recipe):
-    """Kelas turunan untuk resep buatan sendiri."""
-    def __init__(self, name, ingredients, steps, cooking_time, source="Koleksi Pribadi"):
-        super().__init__(name, ingredients, steps, cooking_time)
-        self.source = source
-        
-    def display_details(self):
-        base_details = super().display_details()
-        return f"{base_details}\nSumber: {self.source}"
-
-class RecipeManager:
-    """Mengelola koleksi resep dan struktur data, kini dengan persistensi data."""
-    def __init__(self):
-        self.data_file = "recipe_data.json" 
-        self.recipes = {} 
-        self.shopping_queue = deque()     
-        self.history_stack = []          
-        
-
-        self.is_data_loaded = self.load_data() 
-
-    def add_recipe(self, recipe):
-        if recipe.name not in self.recipes:
-            self.recipes[recipe.name] = recipe
-            return True
-        return False
-
-    def add_to_shopping_list(self, item):
-        """Menambahkan item ke Queue Daftar Belanja."""
-        self.shopping_queue.append(item)
-
-    def remove_from_shopping_list(self):
-        """Mengambil item dari Queue (FIFO)."""
-        if self.shopping_queue:
-            return self.shopping_queue.popleft()
-        return None
-
-    def add_to_history(self, recipe_name):
-        """Menambahkan resep yang dilihat ke Stack."""
-        if recipe_name in self.recipes:
-            self.history_stack.append(recipe_name)
-
-    # ------------------------------------------------------------------
-    # --- FUNGSI PERSISTENSI DATA (JSON I/O) ---
-    # ------------------------------------------------------------------
-
-    def save_data(self):
-        """Menyimpan data resep dan shopping list ke file JSON."""
-        recipes_data = {}
-        for name, recipe in self.recipes.items():
-            data = {
-                "name": recipe.name,
-                "ingredients": recipe.ingredients,
-                "steps": recipe.steps,
-                "cooking_time": recipe.cooking_time,
-
-                "type": "HomemadeRecipe" if isinstance(recipe, HomemadeRecipe) else "Recipe",
-                "source": getattr(recipe, 'source', None) 
-            }
-            recipes_data[name] = data
-
-        data_to_save = {
-            "recipes": recipes_data,
-
-            "shopping_queue": list(self.shopping_queue) 
-        }
-
-        try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data_to_save, f, indent=4)
-            print("💾 Data saved successfully.")
-        except Exception as e:
-            print(f"❌ Error saving data: {e}")
-
-    def load_data(self):
-        """Memuat data resep dan shopping list dari file JSON."""
-        if not os.path.exists(self.data_file):
-            print(f"File '{self.data_file}' not found. Starting with initial data.")
-            return False
-            
-        try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                
-                # Memuat Resep
-                for name, recipe_data in data.get("recipes", {}).items():
-                    # Memilih kelas yang tepat (Polimorfisme)
-                    if recipe_data.get("type") == "HomemadeRecipe":
-                        recipe_obj = HomemadeRecipe(
-                            recipe_data["name"], 
-                            recipe_data["ingredients"], 
-                            recipe_data["steps"], 
-                            recipe_data["cooking_time"],
-                            source=recipe_data.get("source", "Koleksi Pribadi")
-                        )
-                    else:
-                        recipe_obj = Recipe(
-                            recipe_data["name"], 
-                            recipe_data["ingredients"], 
-                            recipe_data["steps"], 
-                            recipe_data["cooking_time"]
-                        )
-                    self.recipes[name] = recipe_obj
-
-                # Memuat Queue
-                self.shopping_queue = deque(data.get("shopping_queue", []))
-            
-            print("✅ Data loaded successfully.")
-            return True
+from recipe_model import Recipe, HomemadeRecipe, RecipeManager, normalize_servings, split_ingredients
 
-        except Exception as e:
-            print(f"❌ Error decoding JSON file or loading data: {e}. Starting with initial data.")
-            return False
-            
 # -----------------------------------------------------------------
 
 # --- MODUL 8: GUI PROGRAMMING (CUSTOMTKINTER) ---
@@ -280,6 +143,19 @@ class App(ctk.CTk):
         # Scrollable Frame Resep
         self.recipe_list_frame = ctk.CTkScrollableFrame(tab, fg_color="transparent", label_text="")
         self.recipe_list_frame.pack(fill="both", expand=True, padx=15, pady=10)
+
+        # Pilihan resep (checkbox + porsi) untuk daftar belanja gabungan
+        self.recipe_selection = {}
+        self.add_selected_button = ctk.CTkButton(
+            tab, 
+            text="ADD SELECTED TO SHOPPING 🛒", 
+            command=self.add_selected_recipes_to_queue,
+            corner_radius=12,
+            fg_color="#0059FF", hover_color="#0051E8", 
+            text_color="#ffffff",
+            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
+        )
+        self.add_selected_button.pack(pady=(0, 10))
         
         self.update_recipe_list()
 
@@ -291,8 +167,14 @@ class App(ctk.CTk):
         recipes_to_display = self.manager.recipes.values()
         
         for i, recipe in enumerate(recipes_to_display):
-            if filter_ingredients and not any(ing.strip().lower() in [r.lower() for r in recipe.ingredients] for ing in filter_ingredients):
+            # Nama bahan dibandingkan tanpa spasi karena kata kunci pencarian juga tanpa spasi
+            ingredient_names = [item.normalized_name.replace(" ", "") for item in recipe.ingredient_items]
+            if filter_ingredients and not any(ing.strip().lower() in ingredient_names for ing in filter_ingredients):
                 continue
+
+            if recipe.name not in self.recipe_selection:
+                self.recipe_selection[recipe.name] = (ctk.BooleanVar(value=False), ctk.StringVar(value=str(recipe.servings)))
+            selected_var, servings_var = self.recipe_selection[recipe.name]
             
             recipe_frame = ctk.CTkFrame(
                 self.recipe_list_frame, 
@@ -302,6 +184,15 @@ class App(ctk.CTk):
                 border_color="#0037FF" 
             ) 
             recipe_frame.pack(fill="x", padx=8, pady=6)
+
+            select_checkbox = ctk.CTkCheckBox(
+                recipe_frame, 
+                text="", 
+                variable=selected_var,
+                width=24,
+                border_color="#0059FF", fg_color="#0059FF"
+            )
+            select_checkbox.pack(side="left", padx=(15, 0), pady=12)
             
             recipe_label = ctk.CTkLabel(
                 recipe_frame, 
@@ -323,6 +214,24 @@ class App(ctk.CTk):
             )
             detail_button.pack(side="right", padx=10, pady=10)
 
+            servings_entry = ctk.CTkEntry(
+                recipe_frame, 
+                textvariable=servings_var,
+                width=50,
+                corner_radius=8,
+                fg_color="#f0f0f0", 
+                text_color="#000000",
+                font=ctk.CTkFont(family="Segoe UI", size=13)
+            )
+            servings_entry.pack(side="right", padx=(0, 5), pady=10)
+
+            ctk.CTkLabel(
+                recipe_frame, 
+                text="PORSI:", 
+                text_color="#2F2F2F",
+                font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold")
+            ).pack(side="right", padx=(10, 5), pady=10)
+
     # ----------------------------------------------------------------------------------
     ## 📝 ADD RECIPE
     # ----------------------------------------------------------------------------------
@@ -334,9 +243,10 @@ class App(ctk.CTk):
         
         label_keys = {
             "RECIPE NAME:": "Nama Resep:", 
-            "INGREDIENTS (COMMA SEPARATED):": "Bahan (dipisahkan koma):", 
+            "INGREDIENTS (SEMICOLON SEPARATED):": "Bahan (dipisahkan titik koma):", 
             "STEPS (COMMA SEPARATED):": "Langkah (dipisahkan koma):", 
-            "COOKING TIME (MINUTES):": "Waktu Masak (menit):"
+            "COOKING TIME (MINUTES):": "Waktu Masak (menit):",
+            "SERVINGS (DEFAULT 1):": "Porsi:"
         }
         
         self.entries = {}
@@ -458,7 +368,7 @@ class App(ctk.CTk):
 
             item_label = ctk.CTkLabel(
                 item_frame, 
-                text=f"► {item.upper()}", 
+                text=f"► {str(item).upper()}", 
                 anchor="w",
                 text_color=text_color,
                 font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
@@ -472,9 +382,10 @@ class App(ctk.CTk):
     def add_new_recipe(self):
         """Menambahkan resep baru dengan validasi dan pengkondisian."""
         name = self.entries["Nama Resep:"].get()
-        ingredients_str = self.entries["Bahan (dipisahkan koma):"].get()
+        ingredients_str = self.entries["Bahan (dipisahkan titik koma):"].get()
         steps_str = self.entries["Langkah (dipisahkan koma):"].get()
         cooking_time_str = self.entries["Waktu Masak (menit):"].get()
+        servings_str = self.entries["Porsi:"].get()
         
         if hasattr(self, 'status_label_shopping'):
             self.status_label_shopping.configure(text="")
@@ -488,11 +399,16 @@ class App(ctk.CTk):
         except ValueError:
             self.status_label_add.configure(text="❌ ERROR: COOKING TIME MUST BE NUMERIC.", text_color="#FF4500")
             return
+
+        servings = normalize_servings(servings_str, default=None) if servings_str else 1
+        if servings is None:
+            self.status_label_add.configure(text="❌ ERROR: SERVINGS MUST BE A POSITIVE NUMBER.", text_color="#FF4500")
+            return
             
-        ingredients = [i.strip() for i in ingredients_str.split(',') if i.strip()]
+        ingredients = split_ingredients(ingredients_str)
         steps = [s.strip() for s in steps_str.split(',') if s.strip()]
         
-        new_recipe = HomemadeRecipe(name, ingredients, steps, cooking_time)
+        new_recipe = HomemadeRecipe(name, ingredients, steps, cooking_time, servings=servings)
         
         if self.manager.add_recipe(new_recipe):
             if cooking_time > 60:
@@ -537,6 +453,7 @@ class App(ctk.CTk):
             f"ESTIMATED PREP TIME: {prep_time} MINS\n"
             f"----------------------------------------\n"
             f"COOKING CYCLE: {recipe.cooking_time} MINS\n"
+            f"SERVINGS: {recipe.servings}\n"
             f"INGREDIENT MANIFEST: {', '.join(recipe.ingredients).upper()}\n"
             f"EXECUTION PROTOCOL:\n" 
             f"   {'; '.join(recipe.steps).upper()}\n" 
@@ -562,11 +479,25 @@ class App(ctk.CTk):
         self.detail_textbox.insert("0.0", detail_text)
         self.detail_textbox.configure(state="disabled") 
         
+        # Input porsi 
+        servings_entry = ctk.CTkEntry(
+            detail_window, 
+            placeholder_text="PORSI", 
+            width=120,
+            corner_radius=10, 
+            fg_color="#ffffff", 
+            text_color="#000000", 
+            border_color="#0059FF", border_width=1,
+            font=ctk.CTkFont(family="Segoe UI", size=14)
+        )
+        servings_entry.insert(0, str(recipe.servings))
+        servings_entry.pack(pady=(0, 10))
+
         # Tombol aksi 
         add_to_queue_button = ctk.CTkButton(
             detail_window, 
             text="ADD TO SHOPPING PROTOCOL 🛒", 
-            command=lambda r=recipe: self.add_recipe_ingredients_to_queue(r, detail_window),
+            command=lambda r=recipe: self.add_recipe_ingredients_to_queue(r, detail_window, servings_entry),
             corner_radius=12,
             fg_color="#0059FF", hover_color="#0051E8", 
             text_color="#ffffff",
@@ -574,20 +505,30 @@ class App(ctk.CTk):
         )
         add_to_queue_button.pack(pady=(0, 20)) 
 
-    def add_recipe_ingredients_to_queue(self, recipe, window):
-        """Menambahkan bahan-bahan resep ke Queue."""
-
-        current_queue_items = {q_item.strip().upper() for q_item in self.manager.shopping_queue}
-        
-        for ing in recipe.ingredients:
-            ing_upper = ing.strip().upper()
-            if ing_upper and ing_upper not in current_queue_items:
-                self.manager.add_to_shopping_list(ing)
-                current_queue_items.add(ing_upper)
+    def add_recipe_ingredients_to_queue(self, recipe, window, servings_entry):
+        """Menambahkan bahan-bahan resep ke Queue sesuai porsi yang diminta."""
+        servings = normalize_servings(servings_entry.get(), default=recipe.servings)
+        self.manager.add_recipes_to_shopping_list({recipe.name: servings})
 
         self.update_shopping_list()
         window.destroy()
         self.tab_view.set("SHOPPING LIST") 
+
+    def add_selected_recipes_to_queue(self):
+        """Menggabungkan bahan dari semua resep yang dicentang ke Queue."""
+        selections = {}
+        for name, (selected_var, servings_var) in self.recipe_selection.items():
+            if selected_var.get() and name in self.manager.recipes:
+                recipe = self.manager.recipes[name]
+                selections[name] = normalize_servings(servings_var.get(), default=recipe.servings)
+                selected_var.set(False)
+
+        if not selections:
+            return
+
+        self.manager.add_recipes_to_shopping_list(selections)
+        self.update_shopping_list()
+        self.tab_view.set("SHOPPING LIST") 
         
     def complete_shopping_item(self):
         """Menyelesaikan item teratas di Queue (FIFO)."""
@@ -596,7 +537,7 @@ class App(ctk.CTk):
             
         item = self.manager.remove_from_shopping_list() 
         if item:
-            self.status_label_shopping.configure(text=f"✅ ACQUISITION COMPLETE: '{item.upper()}'", text_color="#48FF48")
+            self.status_label_shopping.configure(text=f"✅ ACQUISITION COMPLETE: '{str(item).upper()}'", text_color="#48FF48")
             self.update_shopping_list()
         else:
             self.status_label_shopping.configure(text="ℹ️ SHOPPING LIST EMPTY. NO TARGETS IDENTIFIED.", text_color="#646464")
@@ -0,0 +1,146 @@
+import json
+
+import pytest
+
+from recipe_model import (
+    Ingredient, Recipe, RecipeManager, aggregate_ingredients, normalize_servings, split_ingredients,
+)
+
+
+@pytest.mark.parametrize("text, name, quantity, unit", [
+    ("telur", "telur", None, None),
+    ("2 butir telur", "telur", 2, "butir"),
+    ("2 telur", "telur", 2, None),
+    ("1/2 sdt garam", "garam", 0.5, "sdt"),
+    ("1 1/2 gelas air", "air", 1.5, "gelas"),
+    ("1,5 kg beras", "beras", 1.5, "kg"),
+    ("1.000 gram tepung", "tepung", 1000, "gram"),
+    ("1.250,5 ml susu", "susu", 1250.5, "ml"),
+    ("2.500 kg gula", "gula", 2.5, "kg"),
+    ("1.250 liter air", "air", 1.25, "liter"),
+    ("1.5 kg beras", "beras", 1.5, "kg"),
+    ("2.500 gram gula", "gula", 2500, "gram"),
+    ("1.250,5 kg gula", "gula", 1250.5, "kg"),
+    ("200 gr", "200 gr", None, None),
+    ("1/0 sdm gula", "1/0 sdm gula", None, None),
+    ("Sabun Cuci", "Sabun Cuci", None, None),
+])
+def test_parse(text, name, quantity, unit):
+    ing = Ingredient.parse(text)
+    assert (ing.name, ing.quantity, ing.unit) == (name, quantity, unit)
+    assert str(ing) == text
+
+
+def test_scaled():
+    ing = Ingredient.parse("3 sdm kecap manis")
+    assert str(ing.scaled(2)) == "6 sdm kecap manis"
+    assert str(ing.scaled(0.5)) == "1,5 sdm kecap manis"
+    assert ing.scaled(1) is ing
+    bare = Ingredient.parse("garam")
+    assert bare.scaled(3) is bare
+
+
+def test_aggregate_across_units():
+    items = [Ingredient.parse(t) for t in [
+        "1/2 sdt garam", "1 sdm garam", "1.000 gram tepung", "1 kg tepung",
+        "2 butir telur", "3 telur", "Telur",
+    ]]
+    assert [str(i) for i in aggregate_ingredients(items)] == [
+        "3,5 sdt garam", "2 kg tepung", "5 butir telur",
+    ]
+
+
+def test_aggregate_keeps_unmerged_text():
+    items = [Ingredient.parse(t) for t in ["Sabun Cuci", "3 sdm kecap manis", "sabun cuci"]]
+    assert [str(i) for i in aggregate_ingredients(items)] == ["Sabun Cuci", "3 sdm kecap manis"]
+
+
+def test_shopping_list_merge_and_servings(tmp_path):
+    manager = RecipeManager(data_file=str(tmp_path / "data.json"))
+    manager.add_recipe(Recipe("Omelet", ["2 butir telur", "keju"], ["goreng"], 10, servings=2))
+    manager.add_recipe(Recipe("Nasi Goreng", ["telur", "1/2 sdt garam"], ["goreng"], 20))
+    manager.add_to_shopping_list("Sabun Cuci")
+    manager.add_to_shopping_list("1 telur")
+
+    manager.add_recipes_to_shopping_list({"Omelet": 4, "Nasi Goreng": 1})
+    assert [str(item) for item in manager.shopping_queue] == ["Sabun Cuci", "5 telur", "keju", "1/2 sdt garam"]
+
+
+def test_load_old_file_without_servings(tmp_path):
+    data_file = tmp_path / "recipe_data.json"
+    data_file.write_text(json.dumps({
+        "recipes": {
+            "Omelet": {"name": "Omelet", "ingredients": ["telur", "1/0 sdm gula"],
+                       "steps": ["goreng"], "cooking_time": 10, "type": "Recipe", "source": None},
+            "Sup": {"name": "Sup", "ingredients": ["wortel"], "steps": ["rebus"],
+                    "cooking_time": 30, "servings": 0, "type": "HomemadeRecipe", "source": "Buku"},
+            "Teh": {"name": "Teh", "ingredients": ["air"], "steps": ["seduh"],
+                    "cooking_time": 5, "servings": float("nan"), "type": "Recipe", "source": None},
+            "Kopi": {"name": "Kopi", "ingredients": ["air"], "steps": ["seduh"],
+                     "cooking_time": 5, "servings": float("inf"), "type": "Recipe", "source": None},
+        },
+        "shopping_queue": ["tepung terigu"],
+    }))
+
+    manager = RecipeManager(data_file=str(data_file))
+    assert manager.is_data_loaded
+    assert manager.recipes["Omelet"].servings == 1
+    assert manager.recipes["Sup"].servings == 1
+    assert manager.recipes["Teh"].servings == 1
+    assert manager.recipes["Kopi"].servings == 1
+    assert manager.recipes["Sup"].source == "Buku"
+
+    manager.save_data()
+    reloaded = RecipeManager(data_file=str(data_file))
+    assert reloaded.recipes["Omelet"].ingredients == ["telur", "1/0 sdm gula"]
+    assert [str(item) for item in reloaded.shopping_queue] == ["tepung terigu"]
+
+
+def test_ingredient_items_follow_reassignment():
+    recipe = Recipe("Omelet", ["2 butir telur"], ["goreng"], 10)
+    assert recipe.ingredient_items[0].quantity == 2
+    recipe.ingredients = ["3 butir telur"]
+    assert recipe.ingredient_items[0].quantity == 3
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2", 2), (3, 3), ("1,5", 1.5), ("0", 1), ("-2", 1), ("abc", 1), (None, 1),
+    ("nan", 1), ("inf", 1), ("-inf", 1), ("1e400", 1), (float("nan"), 1),
+])
+def test_normalize_servings(value, expected):
+    assert normalize_servings(value) == expected
+
+
+def test_zero_servings_recipe_can_scale():
+    recipe = Recipe("Omelet", ["2 butir telur"], ["goreng"], 10, servings=0)
+    assert recipe.servings == 1
+    assert str(recipe.scale_ingredients(2)[0]) == "4 butir telur"
+
+
+def test_form_split_keeps_decimal_quantities():
+    items = [Ingredient.parse(t) for t in split_ingredients("1,5 kg beras; 2 butir telur;; garam ")]
+    assert [(i.name, i.quantity, i.unit) for i in items] == [
+        ("beras", 1.5, "kg"), ("telur", 2, "butir"), ("garam", None, None),
+    ]
+
+
+def test_repeated_adds_do_not_accumulate_rounding():
+    manager = RecipeManager(data_file=None)
+    manager.add_recipe(Recipe("Teh", ["1/3 gelas gula"], ["seduh"], 5))
+    manager.add_recipes_to_shopping_list({"Teh": 1})
+    manager.add_recipes_to_shopping_list({"Teh": 1})
+    assert manager.shopping_queue[0].quantity == pytest.approx(2 / 3, abs=1e-12)
+    manager.add_recipes_to_shopping_list({"Teh": 1})
+    (item,) = manager.shopping_queue
+    assert item.quantity == pytest.approx(1)
+    assert item.unit == "gelas"
+    assert str(item) == "1 gelas gula"
+
+
+def test_in_memory_manager_skips_disk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = RecipeManager(data_file=None)
+    assert not manager.is_data_loaded
+    manager.add_to_shopping_list("telur")
+    manager.save_data()
+    assert list(tmp_path.iterdir()) == []